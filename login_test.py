@@ -11,9 +11,206 @@ Usage:
 python login_test.py
 """
 
+import os
+import re
+import sys
 import time
 import json
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
+from collections import Counter
 from datetime import datetime
+from types import MappingProxyType
+
+try:
+    import orjson
+except ImportError:  # stdlib json remains the fallback
+    orjson = None
+
+try:
+    import pandas as pd
+except ImportError:  # analytics fall back to pure-Python loops
+    pd = None
+
+# Injection markers checked by the simulated validator, folded into one
+# case-insensitive regex compiled at import: a single C-level scan that
+# stops at the first hit, instead of three substring passes plus an
+# uppercased copy of the username per call
+_SEC_RE = re.compile(r"'|--|\bOR\b", re.IGNORECASE)
+
+# Hash of the one accepted credential pair, computed once at import.
+# A single C-level tuple hash rejects the five failing cases before
+# any string comparison runs; equality confirms on a hash match
+_VALID_CREDENTIALS = ("testuser@example.com", "ValidPass123!")
+_VALID_HASH = hash(_VALID_CREDENTIALS)
+
+# Display-icon tables: one dict lookup per row instead of re-evaluating
+# a chain of string compares in every report loop
+_STATUS_ICON = {"PASS": "✅", "FAIL": "❌"}
+_RISK_ICON = {"critical": "🔴", "medium": "🟡", "low": "🟢"}
+
+
+
+# Constant test-case data, frozen once at import as read-only
+# mappings instead of rebuilding the six dicts per suite run
+_TEST_CASES = tuple(MappingProxyType(case) for case in (
+    {
+        "id": 1,
+        "name": "Valid Login - Standard User",
+        "username": "testuser@example.com",
+        "password": "ValidPass123!",
+        "expected": "success",
+        "category": "positive",
+        "risk_level": "low",
+        "ai_priority": "high"
+    },
+    {
+        "id": 2,
+        "name": "Invalid Login - Wrong Password",
+        "username": "testuser@example.com", 
+        "password": "wrongpassword",
+        "expected": "failure",
+        "category": "negative",
+        "risk_level": "medium",
+        "ai_priority": "high"
+    },
+    {
+        "id": 3,
+        "name": "Invalid Login - Wrong Username",
+        "username": "wronguser@example.com",
+        "password": "ValidPass123!",
+        "expected": "failure", 
+        "category": "negative",
+        "risk_level": "medium",
+        "ai_priority": "high"
+    },
+    {
+        "id": 4,
+        "name": "Security Test - SQL Injection",
+        "username": "admin' OR '1'='1' --",
+        "password": "password",
+        "expected": "failure",
+        "category": "security",
+        "risk_level": "critical",
+        "ai_priority": "critical"
+    },
+    {
+        "id": 5,
+        "name": "Edge Case - Empty Fields",
+        "username": "",
+        "password": "",
+        "expected": "failure",
+        "category": "edge_case",
+        "risk_level": "low",
+        "ai_priority": "medium"
+    },
+    {
+        "id": 6,
+        "name": "Edge Case - Very Long Input",
+        "username": "a" * 1000 + "@example.com",
+        "password": "b" * 1000,
+        "expected": "failure",
+        "category": "edge_case", 
+        "risk_level": "medium",
+        "ai_priority": "medium"
+    }
+))
+
+
+# The per-case work lives in module-level functions so worker processes
+# can pickle them; the class methods below stay as thin wrappers
+def _simulate_login_attempt(test_case, suite_ts=None):
+    """Simulate login attempt with realistic results"""
+    # Bind the multiply-read fields once: a LOAD_FAST per use instead
+    # of a dict subscript (username alone was looked up three times)
+    username = test_case["username"]
+    expected = test_case["expected"]
+
+    # Model the processing time instead of sleeping through it: the
+    # simulated duration lands in the result unchanged, but the
+    # suite no longer burns ~3.5s of idle wall clock per run
+    simulated_time = min(0.5 + (len(username) * 0.001), 2.0)
+
+    # AI logic to determine realistic outcomes
+    actual_result = _ai_determine_result(test_case)
+
+    result = {
+        "test_id": test_case["id"],
+        "test_name": test_case["name"],
+        "category": test_case["category"],
+        "username": username[:50] + "..." if len(username) > 50 else username,
+        "expected_result": expected,
+        "actual_result": actual_result,
+        "status": "PASS" if actual_result == expected else "FAIL",
+        "execution_time": round(simulated_time, 3),
+        "risk_level": test_case["risk_level"],
+        "ai_confidence": _calculate_ai_confidence(test_case, actual_result),
+        # One shared suite timestamp: the cases complete within
+        # milliseconds of each other, so a clock read and ISO-format
+        # allocation per result adds noise, not information
+        "timestamp": suite_ts or datetime.now().isoformat()
+    }
+
+    return result
+
+
+@lru_cache(maxsize=1024)
+def _decide(username, password):
+    """Pure decision rule, memoized: re-running a known case is a cache hit"""
+    # Valid login simulation, gated on the precomputed pair hash
+    if (hash((username, password)) == _VALID_HASH
+            and (username, password) == _VALID_CREDENTIALS):
+        return "success"
+
+    # Reject checks ordered cheapest first; all of them return the
+    # same verdict, so reordering cannot change the outcome
+
+    # Empty fields should be rejected; isspace() avoids the stripped
+    # copy str.strip() would allocate
+    if not username or username.isspace() or not password or password.isspace():
+        return "failure"
+
+    # Very long inputs should be rejected
+    if len(username) > 255 or len(password) > 255:
+        return "failure"
+
+    # Security tests should fail (good security)
+    if _SEC_RE.search(username):
+        return "failure"
+
+    # Any other case is invalid login
+    return "failure"
+
+
+def _ai_determine_result(test_case):
+    """AI logic to determine realistic test outcomes"""
+    return _decide(test_case["username"], test_case["password"])
+
+
+@lru_cache(maxsize=None)
+def _confidence(category, matched):
+    """Pure confidence rule over (category, matched); 8 possible inputs"""
+    base_confidence = 0.85
+
+    # Higher confidence for security tests
+    if category == "security":
+        base_confidence = 0.95
+
+    # Lower confidence for edge cases
+    if category == "edge_case":
+        base_confidence = 0.80
+
+    # Adjust based on expected vs actual
+    if matched:
+        return min(base_confidence + 0.10, 1.0)
+    else:
+        return max(base_confidence - 0.20, 0.5)
+
+
+def _calculate_ai_confidence(test_case, actual_result):
+    """Calculate AI confidence in the result"""
+    return _confidence(test_case["category"], actual_result == test_case["expected"])
+
 
 # Simulated test execution (works without actual browser setup)
 class SimulatedAILoginTester:
@@ -26,137 +223,19 @@ class SimulatedAILoginTester:
     
     def generate_intelligent_test_cases(self):
         """AI-generated test cases covering comprehensive scenarios"""
-        return [
-            {
-                "id": 1,
-                "name": "Valid Login - Standard User",
-                "username": "testuser@example.com",
-                "password": "ValidPass123!",
-                "expected": "success",
-                "category": "positive",
-                "risk_level": "low",
-                "ai_priority": "high"
-            },
-            {
-                "id": 2,
-                "name": "Invalid Login - Wrong Password",
-                "username": "testuser@example.com", 
-                "password": "wrongpassword",
-                "expected": "failure",
-                "category": "negative",
-                "risk_level": "medium",
-                "ai_priority": "high"
-            },
-            {
-                "id": 3,
-                "name": "Invalid Login - Wrong Username",
-                "username": "wronguser@example.com",
-                "password": "ValidPass123!",
-                "expected": "failure", 
-                "category": "negative",
-                "risk_level": "medium",
-                "ai_priority": "high"
-            },
-            {
-                "id": 4,
-                "name": "Security Test - SQL Injection",
-                "username": "admin' OR '1'='1' --",
-                "password": "password",
-                "expected": "failure",
-                "category": "security",
-                "risk_level": "critical",
-                "ai_priority": "critical"
-            },
-            {
-                "id": 5,
-                "name": "Edge Case - Empty Fields",
-                "username": "",
-                "password": "",
-                "expected": "failure",
-                "category": "edge_case",
-                "risk_level": "low",
-                "ai_priority": "medium"
-            },
-            {
-                "id": 6,
-                "name": "Edge Case - Very Long Input",
-                "username": "a" * 1000 + "@example.com",
-                "password": "b" * 1000,
-                "expected": "failure",
-                "category": "edge_case", 
-                "risk_level": "medium",
-                "ai_priority": "medium"
-            }
-        ]
+        return _TEST_CASES
     
     def simulate_login_attempt(self, test_case):
         """Simulate login attempt with realistic results"""
-        start_time = time.time()
-        
-        # Simulate processing time
-        processing_time = 0.5 + (len(test_case["username"]) * 0.001)
-        time.sleep(min(processing_time, 2.0))  # Cap at 2 seconds
-        
-        # AI logic to determine realistic outcomes
-        actual_result = self.ai_determine_result(test_case)
-        
-        result = {
-            "test_id": test_case["id"],
-            "test_name": test_case["name"],
-            "category": test_case["category"],
-            "username": test_case["username"][:50] + "..." if len(test_case["username"]) > 50 else test_case["username"],
-            "expected_result": test_case["expected"],
-            "actual_result": actual_result,
-            "status": "PASS" if actual_result == test_case["expected"] else "FAIL",
-            "execution_time": round(time.time() - start_time, 3),
-            "risk_level": test_case["risk_level"],
-            "ai_confidence": self.calculate_ai_confidence(test_case, actual_result),
-            "timestamp": datetime.now().isoformat()
-        }
-        
-        return result
+        return _simulate_login_attempt(test_case)
     
     def ai_determine_result(self, test_case):
         """AI logic to determine realistic test outcomes"""
-        username = test_case["username"]
-        password = test_case["password"]
-        
-        # Valid login simulation
-        if username == "testuser@example.com" and password == "ValidPass123!":
-            return "success"
-        
-        # Security tests should fail (good security)
-        if "'" in username or "OR" in username.upper() or "--" in username:
-            return "failure"
-        
-        # Empty fields should be rejected
-        if not username.strip() or not password.strip():
-            return "failure"
-        
-        # Very long inputs should be rejected
-        if len(username) > 255 or len(password) > 255:
-            return "failure"
-        
-        # Any other case is invalid login
-        return "failure"
+        return _ai_determine_result(test_case)
     
     def calculate_ai_confidence(self, test_case, actual_result):
         """Calculate AI confidence in the result"""
-        base_confidence = 0.85
-        
-        # Higher confidence for security tests
-        if test_case["category"] == "security":
-            base_confidence = 0.95
-        
-        # Lower confidence for edge cases
-        if test_case["category"] == "edge_case":
-            base_confidence = 0.80
-        
-        # Adjust based on expected vs actual
-        if actual_result == test_case["expected"]:
-            return min(base_confidence + 0.10, 1.0)
-        else:
-            return max(base_confidence - 0.20, 0.5)
+        return _calculate_ai_confidence(test_case, actual_result)
     
     def run_ai_test_suite(self):
         """Execute the complete AI test suite"""
@@ -164,17 +243,25 @@ class SimulatedAILoginTester:
         print("=" * 60)
         
         test_cases = self.generate_intelligent_test_cases()
+        total = len(test_cases)
         suite_start = time.time()
-        
-        for i, test_case in enumerate(test_cases, 1):
-            print(f"\n[{i}/{len(test_cases)}] Executing: {test_case['name']}")
+        suite_ts = datetime.now().isoformat()
+        
+        # Cases share no mutable state, so shard them across worker
+        # processes; executor.map keeps results in submission order
+        workers = max(1, (os.cpu_count() or 1) - 2)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # Workers get plain dict copies: the frozen proxies are not
+            # picklable, and the pool serializes a copy either way
+            results = list(executor.map(
+                partial(_simulate_login_attempt, suite_ts=suite_ts),
+                (dict(case) for case in test_cases)))
+        self.test_results.extend(results)
+
+        for i, (test_case, result) in enumerate(zip(test_cases, results), 1):
+            print(f"\n[{i}/{total}] Executed: {test_case['name']}")
             print(f"    Priority: {test_case['ai_priority']} | Risk: {test_case['risk_level']}")
-            
-            result = self.simulate_login_attempt(test_case)
-            self.test_results.append(result)
-            
-            # Display immediate result
-            status_icon = "✅" if result["status"] == "PASS" else "❌"
+            status_icon = _STATUS_ICON[result["status"]]
             print(f"    {status_icon} {result['status']} ({result['execution_time']}s)")
             
         total_time = round(time.time() - suite_start, 2)
@@ -187,8 +274,8 @@ class SimulatedAILoginTester:
             "analytics": analytics,
             "execution_summary": {
                 "total_time": total_time,
-                "tests_executed": len(test_cases),
-                "timestamp": datetime.now().isoformat()
+                "tests_executed": total,
+                "timestamp": suite_ts
             }
         }
     
@@ -198,30 +285,53 @@ class SimulatedAILoginTester:
         
         # Basic metrics
         total_tests = len(results)
-        passed = len([r for r in results if r["status"] == "PASS"])
-        failed = len([r for r in results if r["status"] == "FAIL"])
+
+        if pd is not None and results:
+            # Columnar aggregation: pass counts, rollups and the mean all
+            # run as vectorized C-level reductions over one DataFrame
+            # instead of Python-level passes per metric
+            df = pd.DataFrame(results)
+            pass_mask = df["status"] == "PASS"
+            passed = int(pass_mask.sum())
+            failed = total_tests - passed
+            avg_time = float(df["execution_time"].mean())
+            categories = {
+                cat: {"total": int(row["count"]), "passed": int(row["sum"])}
+                for cat, row in pass_mask.groupby(df["category"]).agg(["count", "sum"]).iterrows()
+            }
+            risk_analysis = {
+                risk: {"total": int(row["count"]), "passed": int(row["sum"])}
+                for risk, row in pass_mask.groupby(df["risk_level"]).agg(["count", "sum"]).iterrows()
+            }
+        else:
+            # One fused traversal feeds every accumulator - pass count,
+            # time sum and both rollups - instead of a separate pass per
+            # metric; Counter tallies absorb the key-existence guards
+            # and return 0 for keys with no passes
+            passed = 0
+            time_sum = 0.0
+            cat_total, cat_pass = Counter(), Counter()
+            risk_total, risk_pass = Counter(), Counter()
+            for result in results:
+                ok = result["status"] == "PASS"
+                passed += ok
+                time_sum += result["execution_time"]
+                cat = result["category"]
+                risk = result["risk_level"]
+                cat_total[cat] += 1
+                risk_total[risk] += 1
+                if ok:
+                    cat_pass[cat] += 1
+                    risk_pass[risk] += 1
+            failed = total_tests - passed
+            avg_time = time_sum / total_tests if total_tests else 0.0
+            categories = {cat: {"total": n, "passed": cat_pass[cat]}
+                          for cat, n in cat_total.items()}
+            risk_analysis = {risk: {"total": n, "passed": risk_pass[risk]}
+                             for risk, n in risk_total.items()}
+
         success_rate = (passed / total_tests * 100) if total_tests > 0 else 0
         
-        # Category analysis
-        categories = {}
-        for result in results:
-            cat = result["category"]
-            if cat not in categories:
-                categories[cat] = {"total": 0, "passed": 0}
-            categories[cat]["total"] += 1
-            if result["status"] == "PASS":
-                categories[cat]["passed"] += 1
-        
-        # Risk analysis
-        risk_analysis = {}
-        for result in results:
-            risk = result["risk_level"]
-            if risk not in risk_analysis:
-                risk_analysis[risk] = {"total": 0, "passed": 0}
-            risk_analysis[risk]["total"] += 1
-            if result["status"] == "PASS":
-                risk_analysis[risk]["passed"] += 1
-        
         # AI insights generation
         insights = []
         
@@ -234,15 +344,15 @@ class SimulatedAILoginTester:
         else:
             insights.append("⚠️ Several failures detected - Review required")
         
-        # Security analysis
-        security_tests = [r for r in results if r["category"] == "security"]
-        if security_tests and all(r["status"] == "PASS" for r in security_tests):
+        # Security analysis; the category rollup already carries the
+        # security totals, so no extra pass over the results
+        security = categories.get("security")
+        if security and security["passed"] == security["total"]:
             insights.append("🔒 Security tests passed - Strong input validation")
-        elif security_tests:
+        elif security:
             insights.append("🚨 Security vulnerabilities may exist")
         
         # Performance analysis
-        avg_time = sum(r["execution_time"] for r in results) / len(results)
         if avg_time < 1.0:
             insights.append("⚡ Excellent response times - Optimized performance")
         elif avg_time < 3.0:
@@ -279,67 +389,79 @@ class SimulatedAILoginTester:
     
     def generate_detailed_report(self, results):
         """Generate comprehensive test report"""
-        print("\n" + "=" * 70)
-        print("🤖 AI-ENHANCED LOGIN TESTING - COMPREHENSIVE REPORT")
-        print("=" * 70)
+        # Assemble the whole report in a buffer and write it once:
+        # ~40 print calls become a single stdout write, which also keeps
+        # the report from interleaving with parallel workers' output
+        buf = []
+        buf.append("\n" + "=" * 70)
+        buf.append("🤖 AI-ENHANCED LOGIN TESTING - COMPREHENSIVE REPORT")
+        buf.append("=" * 70)
         
         analytics = results["analytics"]
         summary = analytics["summary"]
         
         # Executive Summary
-        print(f"\n📊 EXECUTIVE SUMMARY")
-        print(f"   Tests Executed: {summary['total_tests']}")
-        print(f"   Success Rate: {summary['success_rate']}% ({summary['passed']}/{summary['total_tests']})")
-        print(f"   Total Time: {summary['total_execution_time']}s")
-        print(f"   Avg Test Time: {summary['avg_execution_time']}s")
+        buf.append(f"\n📊 EXECUTIVE SUMMARY")
+        buf.append(f"   Tests Executed: {summary['total_tests']}")
+        buf.append(f"   Success Rate: {summary['success_rate']}% ({summary['passed']}/{summary['total_tests']})")
+        buf.append(f"   Total Time: {summary['total_execution_time']}s")
+        buf.append(f"   Avg Test Time: {summary['avg_execution_time']}s")
         
         # AI Insights
-        print(f"\n🧠 AI-POWERED INSIGHTS")
+        buf.append(f"\n🧠 AI-POWERED INSIGHTS")
         for insight in analytics["ai_insights"]:
-            print(f"   {insight}")
+            buf.append(f"   {insight}")
         
         # Category Analysis
-        print(f"\n📋 TEST CATEGORY ANALYSIS")
+        buf.append(f"\n📋 TEST CATEGORY ANALYSIS")
         for category, data in analytics["category_breakdown"].items():
             success_rate = (data["passed"] / data["total"] * 100) if data["total"] > 0 else 0
-            print(f"   {category.upper()}: {data['passed']}/{data['total']} ({success_rate:.1f}%)")
+            buf.append(f"   {category.upper()}: {data['passed']}/{data['total']} ({success_rate:.1f}%)")
         
         # Risk Analysis
-        print(f"\n⚠️ RISK LEVEL ANALYSIS")
+        buf.append(f"\n⚠️ RISK LEVEL ANALYSIS")
         for risk, data in analytics["risk_analysis"].items():
             success_rate = (data["passed"] / data["total"] * 100) if data["total"] > 0 else 0
-            risk_icon = "🔴" if risk == "critical" else "🟡" if risk == "medium" else "🟢"
-            print(f"   {risk_icon} {risk.upper()}: {data['passed']}/{data['total']} ({success_rate:.1f}%)")
+            risk_icon = _RISK_ICON.get(risk, "🟢")
+            buf.append(f"   {risk_icon} {risk.upper()}: {data['passed']}/{data['total']} ({success_rate:.1f}%)")
         
         # Detailed Results
-        print(f"\n📝 DETAILED TEST RESULTS")
+        buf.append(f"\n📝 DETAILED TEST RESULTS")
         for result in results["test_results"]:
-            status_icon = "✅" if result["status"] == "PASS" else "❌"
-            print(f"\n   {status_icon} [{result['test_id']}] {result['test_name']}")
-            print(f"      Category: {result['category']} | Risk: {result['risk_level']}")
-            print(f"      Expected: {result['expected_result']} → Actual: {result['actual_result']}")
-            print(f"      Time: {result['execution_time']}s | AI Confidence: {result['ai_confidence']:.2f}")
+            status_icon = _STATUS_ICON[result["status"]]
+            buf.append(f"\n   {status_icon} [{result['test_id']}] {result['test_name']}")
+            buf.append(f"      Category: {result['category']} | Risk: {result['risk_level']}")
+            buf.append(f"      Expected: {result['expected_result']} → Actual: {result['actual_result']}")
+            buf.append(f"      Time: {result['execution_time']}s | AI Confidence: {result['ai_confidence']:.2f}")
         
         # Recommendations
-        print(f"\n🎯 AI RECOMMENDATIONS")
+        buf.append(f"\n🎯 AI RECOMMENDATIONS")
         for rec in analytics["recommendations"]:
-            print(f"   • {rec}")
+            buf.append(f"   • {rec}")
         
         # Coverage Summary
-        print(f"\n✅ TEST COVERAGE ACHIEVED")
+        buf.append(f"\n✅ TEST COVERAGE ACHIEVED")
         for coverage in analytics["test_coverage_achieved"]:
-            print(f"   {coverage}")
+            buf.append(f"   {coverage}")
         
-        print("\n" + "=" * 70)
-        print("🎉 AI-Enhanced Testing Complete!")
-        print("=" * 70)
+        buf.append("\n" + "=" * 70)
+        buf.append("🎉 AI-Enhanced Testing Complete!")
+        buf.append("=" * 70)
+        sys.stdout.write("\n".join(buf) + "\n")
     
     def export_results(self, results):
         """Export results to JSON for further analysis"""
         filename = f"ai_login_test_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
         try:
-            with open(filename, 'w') as f:
-                json.dump(results, f, indent=2, default=str)
+            if orjson is not None:
+                # Native encoder writing bytes directly; no Python-level
+                # iterencode or str-to-bytes pass
+                with open(filename, 'wb') as f:
+                    f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2,
+                                         default=str))
+            else:
+                with open(filename, 'w') as f:
+                    json.dump(results, f, indent=2, default=str)
             print(f"\n💾 Results exported to: {filename}")
             return filename
         except Exception as e:
@@ -1,11 +1,17 @@
 # Manual implementation
 def manual_sort(data, key):
     """Sort list of dictionaries by specified key"""
-    n = len(data)
-    for i in range(n):
-        for j in range(0, n-i-1):
-            if data[j][key] > data[j+1][key]:
-                data[j], data[j+1] = data[j+1], data[j]
+    # Insertion sort: shifts instead of pairwise swaps, finishes in
+    # linear time on sorted or nearly-sorted input, and hoisting the
+    # pivot's key value gives one dict lookup per comparison
+    for i in range(1, len(data)):
+        item = data[i]
+        value = item[key]
+        j = i - 1
+        while j >= 0 and data[j][key] > value:
+            data[j+1] = data[j]
+            j -= 1
+        data[j+1] = item
     return data
 
 # AI-suggested implementation (GitHub Copilot style)
@@ -21,22 +27,29 @@ employees = [
 ]
 
 # Performance comparison
-import timeit
-
-manual_time = timeit.timeit(
-    'manual_sort(employees.copy(), "age")', 
-    globals=globals(), 
-    number=1000
-)
-
-ai_time = timeit.timeit(
-    'ai_sort(employees.copy(), "age")', 
-    globals=globals(), 
-    number=1000
-)
-
-print(f"Manual sort time: {manual_time:.5f}s")
-print(f"AI-suggested sort time: {ai_time:.5f}s")
-print(f"AI implementation is {manual_time/ai_time:.1f}x faster")
-
-
+if __name__ == "__main__":
+    # Guarded so importing this module doesn't run the benchmark
+    import time
+
+    NUMBER = 1000
+
+    def benchmark(func, number=NUMBER):
+        """Time func over pre-copied inputs, isolating the sort cost"""
+        # Copies are made up front so the per-iteration list.copy()
+        # (~300ns each) stays out of the measurement
+        pool = [employees.copy() for _ in range(number)]
+        # A short warmup lets CPython's adaptive interpreter specialize
+        # the bytecode before the timed loop
+        for _ in range(10):
+            func(employees.copy(), "age")
+        start = time.perf_counter_ns()
+        for data in pool:
+            func(data, "age")
+        return (time.perf_counter_ns() - start) / 1e9
+
+    manual_time = benchmark(manual_sort)
+    ai_time = benchmark(ai_sort)
+
+    print(f"Manual sort time: {manual_time:.5f}s")
+    print(f"AI-suggested sort time: {ai_time:.5f}s")
+    print(f"AI implementation is {manual_time/ai_time:.1f}x faster")